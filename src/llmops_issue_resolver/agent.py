@@ -1,11 +1,4 @@
 import os
-import sys
-
-sys.path.append(
-    os.path.join("relative_path_to_llmops_issue_resolver", os.path.dirname(__file__))
-)
-
-import json
 import shutil
 from typing import Annotated, List, Literal, Sequence, TypedDict
 
@@ -25,6 +18,10 @@ from langgraph.prebuilt import ToolNode  # type: ignore
 
 load_dotenv()
 
+black_mode = black.Mode()
+
+ignored_directory_entries = frozenset((".venv", "venv", ".git", "CURRENT-PROBLEMS.md"))
+
 class AgentState(TypedDict):
     messages: Annotated[Sequence[BaseMessage], add_messages]
 
@@ -48,15 +45,18 @@ def get_directory_structure(path: str = ".") -> str:
                 "nodeType": "directory",
                 "children": []
             }
-            for item in sorted(os.listdir(current_path)):
-                if item in (".venv", "venv", ".git", "CURRENT-PROBLEMS.md"):
+            with os.scandir(current_path) as entries:
+                items = sorted(entries, key=lambda entry: entry.name)
+            for item in items:
+                if item.name in ignored_directory_entries:
                     continue
-                full_path = os.path.join(current_path, item)
-                if os.path.isdir(full_path):
-                    structure["children"].append(build_structure(full_path)) # type: ignore
+                # DirEntry.is_dir() reuses the file type reported by the directory
+                # listing, so no extra stat() is needed for each entry
+                if item.is_dir():
+                    structure["children"].append(build_structure(item.path)) # type: ignore
                 else:
                     structure["children"].append({ # type: ignore
-                        "name": item,
+                        "name": item.name,
                         "nodeType": "file"
                     })
         else:
@@ -111,7 +111,7 @@ def create_file(path: str, file_name: str) -> str:
         - path: The path where the file will be created.
         - file_name: The name of the file to create.
     """
-    with open(f"{path}/{file_name}", "w", encoding="utf-8") as file:
+    with open(f"{path}/{file_name}", "wb"):
         pass
     return f"File {path}/{file_name} created."
 
@@ -149,7 +149,7 @@ def update_file(path: str, new_content: str) -> str:
     """
     try:
         formatted_content = new_content.replace("\\\"", "\"").replace("\\n", "\n")
-        updated_content = black.format_str(formatted_content, mode=black.Mode())
+        updated_content = black.format_str(formatted_content, mode=black_mode)
     except Exception as e:
         raise ValueError(f"Erro ao formatar o código com Black: {e}")
 
@@ -212,6 +212,8 @@ Follow these steps:
     7. Apply the diffs using the tools to create, rename, update and delete files and folders.
 """
 
+system_message = {"role": "system", "content": system_prompt}
+
 def should_continue(state: MessagesState) -> Literal["tools", END]: # type: ignore
     """Determine whether the agent should continue based on the state.
     
@@ -231,9 +233,7 @@ def call_model(state: MessagesState) -> dict:
         - state: The current state of the agent.
     """
     messages = state['messages']
-    messages = [
-        {"role": "system", "content": system_prompt}
-    ] + messages
+    messages = [system_message] + messages
     response = model.invoke(messages)
     return {"messages": [response]}
 
@@ -1,46 +1,7 @@
 import os
-import sys
-from contextlib import contextmanager
 
 import typer
 
-from llmops_issue_resolver.agent import graph
-
-
-@contextmanager
-def temporary_sys_path(path):
-    """
-    A context manager to temporarily add a specified path to the system path.
-    This context manager appends the given path to `sys.path` and ensures that 
-    the original `sys.path` is restored after the context is exited.
-    Args:
-        path (str): The path to be temporarily added to `sys.path`.
-    Yields:
-        None: This context manager does not yield any value.
-    Example:
-        with temporary_sys_path('/some/path'):
-            # Perform operations that require the temporary path
-    """
-    original_sys_path = sys.path.copy()
-    sys.path.append(path)
-    try:
-        yield
-    finally:
-        sys.path = original_sys_path
-
-# do some imports 'assuming' that the package is installed
-# before: 'from agent import ..."
-# now: "from llmops_issue_resolver.agent import ..."
-# But why do this? 
-#     - Because mypy assumes this notation when importing from modules within a package
-#     - Because it makes it cleanar for doing imports within modules that are very deep 
-#     and want to import from modules that are near surface of the package directory 
-#     tree
-# All .py modules need to have this line, but with the more general form of the import 
-
-# with temporary_sys_path(os.path.dirname(__file__)):
-#    <package_based_imports>
-
 app = typer.Typer()
 
 @app.command()
@@ -50,6 +11,10 @@ def resolve_issue():
         2. Makes changes to resolve the issue
         3. Writes commit message to commit_message.txt
     """
+    # imported here so that other commands don't pay for loading langchain/langgraph
+    # and building the model at startup
+    from llmops_issue_resolver.agent import graph
+
     typer.echo("Started Issue Resolution Attempt")
 
     events = graph.stream(